@@ -89,7 +89,3 @@ async def main():
     except Exception as err:
         _LOG.critical("Fatal error: %s", err, exc_info=True)
         raise
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
@@ -12,7 +12,9 @@ import sys
 
 from uc_intg_anthemav import main
 
-if __name__ == "__main__":
+
+def run() -> None:
+    """Run the integration until interrupted."""
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -22,4 +24,8 @@ if __name__ == "__main__":
         print(f"❌ Integration failed: {err}")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -16,8 +16,44 @@ from .config import AnthemDeviceConfig
 
 _LOG = logging.getLogger(__name__)
 
+_DEFAULT_INPUTS = (
+    "HDMI 1", "HDMI 2", "HDMI 3", "HDMI 4",
+    "HDMI 5", "HDMI 6", "HDMI 7", "HDMI 8",
+    "Analog 1", "Analog 2",
+    "Digital 1", "Digital 2",
+    "USB", "Network", "ARC"
+)
+_DEFAULT_INPUT_NUMBERS = {name: num for num, name in enumerate(_DEFAULT_INPUTS, start=1)}
+
+_RE_ICN = re.compile(r'ICN(\d+)')
+_RE_ISN = re.compile(r'ISN(\d{2})(.+)')
+_RE_ZONE = re.compile(r'Z(\d+)([A-Z]{3})(.*)')
+_RE_VOL = re.compile(r'-?\d+')
+_RE_INP = re.compile(r'\d+')
+
+
+def _zone_commands(command: str) -> dict[int, bytes]:
+    """Pre-encode a fixed zone command for every zone."""
+    return {zone: f"Z{zone}{command}\r".encode('ascii') for zone in range(1, 5)}
+
 
 class AnthemDevice(PersistentConnectionDevice):
+    # Volume range is -90dB..0dB, exposed to entities as 0..100%
+    _DB_SCALE_PCT = 100.0 / 90.0
+    _DB_SCALE_DB = 90.0 / 100.0
+    
+    # Fixed per-zone commands, encoded once
+    _CMD_POW_ON = _zone_commands("POW1")
+    _CMD_POW_OFF = _zone_commands("POW0")
+    _CMD_VUP = _zone_commands("VUP")
+    _CMD_VDN = _zone_commands("VDN")
+    _CMD_MUT_ON = _zone_commands("MUT1")
+    _CMD_MUT_OFF = _zone_commands("MUT0")
+    _CMD_QUERY_STATUS = {
+        zone: b"".join(_zone_commands(query)[zone] for query in ("POW?", "VOL?", "MUT?", "INP?"))
+        for zone in range(1, 5)
+    }
+    
     def __init__(self, device_config: AnthemDeviceConfig, **kwargs):
         super().__init__(device_config, **kwargs)
         self._device_config = device_config
@@ -26,6 +62,10 @@ class AnthemDevice(PersistentConnectionDevice):
         self._zone_states: dict[int, dict[str, Any]] = {}
         self._input_names: dict[int, str] = {}
         self._input_count: int = 0
+        self._pending_input_queries: dict[int, asyncio.Future] = {}
+        self._inputs_ready = asyncio.Event()
+        self._input_list_cache: list[str] | None = None
+        self._input_name_to_num: dict[str, int] | None = None
         
     @property
     def identifier(self) -> str:
@@ -66,10 +106,11 @@ class AnthemDevice(PersistentConnectionDevice):
         await asyncio.sleep(0.2)
         
         # Query initial state for all zones
-        for zone in self._device_config.zones:
-            if zone.enabled:
-                await self._send_command(f"Z{zone.zone_number}POW?")
-                await asyncio.sleep(0.05)
+        await self._send_commands_batch([
+            f"Z{zone.zone_number}POW?"
+            for zone in self._device_config.zones
+            if zone.enabled
+        ])
         
         _LOG.info("[%s] Connection established and initialized", self.log_id)
         return (self._reader, self._writer)
@@ -85,32 +126,31 @@ class AnthemDevice(PersistentConnectionDevice):
         
         self._reader = None
         self._writer = None
+        self._inputs_ready.clear()
     
     async def maintain_connection(self) -> None:
-        buffer = ""
         _LOG.debug("[%s] Message loop started", self.log_id)
         
         while self._reader and not self._reader.at_eof():
             try:
-                data = await asyncio.wait_for(self._reader.read(1024), timeout=120.0)
-                
-                if not data:
-                    _LOG.warning("[%s] Connection closed by device", self.log_id)
-                    break
-                
-                decoded = data.decode('ascii', errors='ignore')
-                buffer += decoded
+                # CRITICAL: Responses are terminated by semicolon, not newline!
+                data = await asyncio.wait_for(self._reader.readuntil(b';'), timeout=120.0)
                 
-                # CRITICAL: Split on semicolon, not newline!
-                while ';' in buffer:
-                    line, buffer = buffer.split(';', 1)
-                    line = line.strip()
-                    if line:
-                        await self._process_response(line)
+                # Trim and skip keep-alive separators before paying for a decode
+                line = data[:-1].strip()
+                if line:
+                    await self._process_response(line.decode('ascii', errors='ignore'))
                 
             except asyncio.TimeoutError:
                 # Normal timeout, continue
                 continue
+            except asyncio.IncompleteReadError:
+                _LOG.warning("[%s] Connection closed by device", self.log_id)
+                break
+            except asyncio.LimitOverrunError as err:
+                # No terminator within the stream limit; drop the garbage and resync
+                _LOG.warning("[%s] Discarding %d bytes of unterminated data", self.log_id, err.consumed)
+                await self._reader.read(err.consumed)
             except Exception as err:
                 _LOG.error("[%s] Error in message loop: %s", self.log_id, err)
                 break
@@ -124,23 +164,40 @@ class AnthemDevice(PersistentConnectionDevice):
         Commands are terminated with carriage return (\r), but responses
         come back terminated with semicolon (;).
         """
+        return await self._send_bytes(f"{command}\r".encode('ascii'))
+    
+    async def _send_commands_batch(self, commands: list[str]) -> bool:
+        """
+        Send several commands to receiver in a single write.
+        
+        Each command keeps its own carriage return terminator, so the
+        receiver handles the payload exactly like individual sends.
+        """
+        if not commands:
+            return True
+        return await self._send_bytes("".join(f"{command}\r" for command in commands).encode('ascii'))
+    
+    async def _send_bytes(self, payload: bytes) -> bool:
+        """Write already encoded, CR-terminated command(s) to receiver."""
         if not self._writer:
             _LOG.warning("[%s] Cannot send command - not connected", self.log_id)
             return False
         
         try:
-            cmd_bytes = f"{command}\r".encode('ascii')
-            self._writer.write(cmd_bytes)
+            self._writer.write(payload)
             await self._writer.drain()
-            _LOG.debug("[%s] Sent command: %s", self.log_id, command)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("[%s] Sent command: %s", self.log_id, payload)
             return True
         except Exception as err:
-            _LOG.error("[%s] Error sending command %s: %s", self.log_id, command, err)
+            _LOG.error("[%s] Error sending command %s: %s", self.log_id, payload, err)
             return False
     
     async def _process_response(self, response: str) -> None:
         """Process a response from the receiver."""
-        _LOG.debug("[%s] RECEIVED: %s", self.log_id, response)
+        # log_id is formatted on access; skip it when DEBUG is off
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("[%s] RECEIVED: %s", self.log_id, response)
         
         # Ignore error responses
         if response.startswith("!I") or response.startswith("!E"):
@@ -152,99 +209,118 @@ class AnthemDevice(PersistentConnectionDevice):
     
     def _update_state_from_response(self, response: str) -> None:
         """Update device state from response."""
-        # Device info responses
-        if response.startswith("IDM"):
-            model = response[3:].strip()
-            self._state = {"model": model}
-            _LOG.info("[%s] Model: %s", self.log_id, model)
-        
-        elif response.startswith("ICN"):
-            count_match = re.match(r'ICN(\d+)', response)
-            if count_match:
-                self._input_count = int(count_match.group(1))
-                _LOG.info("[%s] Input count: %d", self.log_id, self._input_count)
-                # Query input names
-                asyncio.create_task(self._discover_input_names())
+        handler = self._RESPONSE_HANDLERS.get(response[:3])
+        if handler:
+            handler(self, response)
+        elif response.startswith("Z"):
+            self._handle_zone_response(response)
+    
+    # Device info responses
+    
+    def _handle_idm(self, response: str) -> None:
+        model = response[3:].strip()
+        self._state = {"model": model}
+        _LOG.info("[%s] Model: %s", self.log_id, model)
+    
+    def _handle_icn(self, response: str) -> None:
+        count_match = _RE_ICN.match(response)
+        if count_match:
+            self._input_count = int(count_match.group(1))
+            self._invalidate_input_caches()
+            _LOG.info("[%s] Input count: %d", self.log_id, self._input_count)
+            # Query input names
+            asyncio.create_task(self._discover_input_names())
+    
+    def _handle_isn(self, response: str) -> None:
+        if len(response) <= 5:
+            return
+        input_match = _RE_ISN.match(response)
+        if input_match:
+            input_num = int(input_match.group(1))
+            input_name = input_match.group(2).strip()
+            self._input_names[input_num] = input_name
+            self._invalidate_input_caches()
+            _LOG.debug("[%s] Input %d: %s", self.log_id, input_num, input_name)
+            
+            pending = self._pending_input_queries.get(input_num)
+            if pending and not pending.done():
+                pending.set_result(input_name)
+    
+    _RESPONSE_HANDLERS = {
+        "IDM": _handle_idm,
+        "ICN": _handle_icn,
+        "ISN": _handle_isn,
+    }
+    
+    # Zone state responses (Z<zone><CMD><value>)
+    
+    def _handle_zone_response(self, response: str) -> None:
+        zone_match = _RE_ZONE.match(response)
+        if not zone_match:
+            return
         
-        elif response.startswith("ISN") and len(response) > 5:
-            input_match = re.match(r'ISN(\d{2})(.+)', response)
-            if input_match:
-                input_num = int(input_match.group(1))
-                input_name = input_match.group(2).strip()
-                self._input_names[input_num] = input_name
-                _LOG.debug("[%s] Input %d: %s", self.log_id, input_num, input_name)
-                
-                # If we've discovered all inputs, emit source list update to all entities
-                if len(self._input_names) == self._input_count:
-                    _LOG.info("[%s] All %d inputs discovered, updating source lists", self.log_id, self._input_count)
-                    source_list = self.get_input_list()
-                    
-                    # Emit source_list update to all zones
-                    for zone_config in self._device_config.zones:
-                        if zone_config.enabled:
-                            entity_id = self._get_entity_id_for_zone(zone_config.zone_number)
-                            if entity_id:
-                                self.events.emit(DeviceEvents.UPDATE, entity_id, {"source_list": source_list})
+        handler = self._ZONE_HANDLERS.get(zone_match.group(2))
+        if not handler:
+            return
         
-        # Zone state responses
-        elif response.startswith("Z"):
-            zone_match = re.match(r'Z(\d+)', response)
-            if zone_match:
-                zone_num = int(zone_match.group(1))
-                
-                if zone_num not in self._zone_states:
-                    self._zone_states[zone_num] = {}
-                
-                state = self._zone_states[zone_num]
-                entity_id = self._get_entity_id_for_zone(zone_num)
-                
-                if "POW" in response:
-                    power = "1" in response
-                    state["power"] = power
-                    new_state = "ON" if power else "OFF"
-                    self._state = new_state
-                    
-                    # Emit update for this specific zone entity
-                    if entity_id:
-                        self.events.emit(DeviceEvents.UPDATE, entity_id, {"state": new_state})
-                
-                elif "VOL" in response:
-                    vol_match = re.search(r'VOL(-?\d+)', response)
-                    if vol_match:
-                        volume_db = int(vol_match.group(1))
-                        state["volume_db"] = volume_db
-                        # Convert to percentage (0-100 range)
-                        volume_pct = int(((volume_db + 90) / 90) * 100)
-                        
-                        if entity_id:
-                            self.events.emit(DeviceEvents.UPDATE, entity_id, {
-                                "volume": volume_pct,
-                                "state": state.get("power", False) and "ON" or "OFF"
-                            })
-                
-                elif "MUT" in response:
-                    muted = "1" in response
-                    state["muted"] = muted
-                    
-                    if entity_id:
-                        self.events.emit(DeviceEvents.UPDATE, entity_id, {
-                            "muted": muted,
-                            "state": state.get("power", False) and "ON" or "OFF"
-                        })
-                
-                elif "INP" in response:
-                    inp_match = re.search(r'INP(\d+)', response)
-                    if inp_match:
-                        input_num = int(inp_match.group(1))
-                        state["input"] = input_num
-                        input_name = self._input_names.get(input_num, f"Input {input_num}")
-                        state["input_name"] = input_name
-                        
-                        if entity_id:
-                            self.events.emit(DeviceEvents.UPDATE, entity_id, {
-                                "source": input_name,
-                                "state": state.get("power", False) and "ON" or "OFF"
-                            })
+        zone_num = int(zone_match.group(1))
+        state = self._zone_states.setdefault(zone_num, {})
+        entity_id = self._get_entity_id_for_zone(zone_num)
+        handler(self, state, entity_id, zone_match.group(3))
+    
+    def _handle_zone_power(self, state: dict[str, Any], entity_id: str | None, value: str) -> None:
+        power = value == "1"
+        state["power"] = power
+        new_state = "ON" if power else "OFF"
+        self._state = new_state
+        self._emit_zone_update(state, entity_id, {})
+    
+    def _handle_zone_volume(self, state: dict[str, Any], entity_id: str | None, value: str) -> None:
+        vol_match = _RE_VOL.match(value)
+        if vol_match:
+            volume_db = int(vol_match.group(0))
+            state["volume_db"] = volume_db
+            volume_pct = self.db_to_percentage(volume_db)
+            self._emit_zone_update(state, entity_id, {"volume": volume_pct})
+    
+    def _handle_zone_mute(self, state: dict[str, Any], entity_id: str | None, value: str) -> None:
+        muted = value == "1"
+        state["muted"] = muted
+        self._emit_zone_update(state, entity_id, {"muted": muted})
+    
+    def _handle_zone_input(self, state: dict[str, Any], entity_id: str | None, value: str) -> None:
+        inp_match = _RE_INP.match(value)
+        if inp_match:
+            input_num = int(inp_match.group(0))
+            state["input"] = input_num
+            input_name = self._input_names.get(input_num, f"Input {input_num}")
+            state["input_name"] = input_name
+            self._emit_zone_update(state, entity_id, {"source": input_name})
+    
+    @classmethod
+    def db_to_percentage(cls, volume_db: int) -> int:
+        """Convert receiver volume in dB (-90 to 0) to percentage (0-100)."""
+        volume_pct = int((volume_db + 90) * cls._DB_SCALE_PCT)
+        return 0 if volume_pct < 0 else 100 if volume_pct > 100 else volume_pct
+    
+    @classmethod
+    def percentage_to_db(cls, volume_pct: float) -> int:
+        """Convert percentage (0-100) to receiver volume in dB (-90 to 0)."""
+        volume_db = int(volume_pct * cls._DB_SCALE_DB - 90)
+        return -90 if volume_db < -90 else 0 if volume_db > 0 else volume_db
+    
+    def _emit_zone_update(self, state: dict[str, Any], entity_id: str | None, update: dict[str, Any]) -> None:
+        """Emit an update for a zone entity, always including its power state."""
+        if entity_id:
+            update["state"] = "ON" if state.get("power", False) else "OFF"
+            self.events.emit(DeviceEvents.UPDATE, entity_id, update)
+    
+    _ZONE_HANDLERS = {
+        "POW": _handle_zone_power,
+        "VOL": _handle_zone_volume,
+        "MUT": _handle_zone_mute,
+        "INP": _handle_zone_input,
+    }
     
     def _get_entity_id_for_zone(self, zone_num: int) -> str | None:
         """Get entity ID for a zone number."""
@@ -253,10 +329,53 @@ class AnthemDevice(PersistentConnectionDevice):
         return f"media_player.{self.identifier}.zone{zone_num}"
     
     async def _discover_input_names(self) -> None:
-        """Query input names from receiver."""
-        for input_num in range(1, self._input_count + 1):
-            await self._send_command(f"ISN{input_num:02d}?")
-            await asyncio.sleep(0.05)
+        """Query input names from receiver and wait for the replies."""
+        loop = asyncio.get_running_loop()
+        self._pending_input_queries = {
+            input_num: loop.create_future()
+            for input_num in range(1, self._input_count + 1)
+        }
+        
+        await self._send_commands_batch([
+            f"ISN{input_num:02d}?" for input_num in self._pending_input_queries
+        ])
+        
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*self._pending_input_queries.values()),
+                timeout=3.0
+            )
+            _LOG.info("[%s] All %d inputs discovered, updating source lists", self.log_id, self._input_count)
+        except asyncio.TimeoutError:
+            _LOG.warning("[%s] Input discovery timed out (%d of %d names received)",
+                         self.log_id, len(self._input_names), self._input_count)
+        finally:
+            self._pending_input_queries = {}
+        
+        if self._input_names:
+            self._emit_source_list()
+        self._inputs_ready.set()
+    
+    async def wait_for_inputs(self, timeout: float) -> bool:
+        """
+        Wait until input name discovery has finished.
+        
+        :return: True if discovery finished within the timeout
+        """
+        try:
+            await asyncio.wait_for(self._inputs_ready.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def _emit_source_list(self) -> None:
+        """Emit the current source list to all enabled zone entities."""
+        source_list = self.get_input_list()
+        for zone_config in self._device_config.zones:
+            if zone_config.enabled:
+                entity_id = self._get_entity_id_for_zone(zone_config.zone_number)
+                if entity_id:
+                    self.events.emit(DeviceEvents.UPDATE, entity_id, {"source_list": source_list})
     
     # ========================================================================
     # Public Control Methods
@@ -264,11 +383,11 @@ class AnthemDevice(PersistentConnectionDevice):
     
     async def power_on(self, zone: int = 1) -> bool:
         """Turn on the specified zone."""
-        return await self._send_command(f"Z{zone}POW1")
+        return await self._send_bytes(self._CMD_POW_ON[zone])
     
     async def power_off(self, zone: int = 1) -> bool:
         """Turn off the specified zone."""
-        return await self._send_command(f"Z{zone}POW0")
+        return await self._send_bytes(self._CMD_POW_OFF[zone])
     
     async def set_volume(self, volume_db: int, zone: int = 1) -> bool:
         """Set volume in dB (-90 to 0)."""
@@ -277,32 +396,23 @@ class AnthemDevice(PersistentConnectionDevice):
     
     async def volume_up(self, zone: int = 1) -> bool:
         """Increase volume by 1dB."""
-        return await self._send_command(f"Z{zone}VUP")
+        return await self._send_bytes(self._CMD_VUP[zone])
     
     async def volume_down(self, zone: int = 1) -> bool:
         """Decrease volume by 1dB."""
-        return await self._send_command(f"Z{zone}VDN")
+        return await self._send_bytes(self._CMD_VDN[zone])
     
     async def set_mute(self, muted: bool, zone: int = 1) -> bool:
         """Set mute state."""
-        return await self._send_command(f"Z{zone}MUT{'1' if muted else '0'}")
+        return await self._send_bytes((self._CMD_MUT_ON if muted else self._CMD_MUT_OFF)[zone])
     
     async def select_input(self, input_num: int, zone: int = 1) -> bool:
         """Select input source."""
         return await self._send_command(f"Z{zone}INP{input_num}")
     
     async def query_status(self, zone: int = 1) -> bool:
-        """Query all status for a zone."""
-        commands = [
-            f"Z{zone}POW?",
-            f"Z{zone}VOL?",
-            f"Z{zone}MUT?",
-            f"Z{zone}INP?"
-        ]
-        for cmd in commands:
-            await self._send_command(cmd)
-            await asyncio.sleep(0.05)
-        return True
+        """Query all status for a zone; replies update state as they arrive."""
+        return await self._send_bytes(self._CMD_QUERY_STATUS[zone])
     
     def get_input_list(self) -> list[str]:
         if self._device_config.discovered_inputs:
@@ -310,41 +420,37 @@ class AnthemDevice(PersistentConnectionDevice):
                       self.log_id, len(self._device_config.discovered_inputs))
             return self._device_config.discovered_inputs
         
-        # PRIORITY 2: Use runtime discovered names
-        if self._input_names and self._input_count > 0:
-            _LOG.debug("[%s] Using runtime discovered inputs (%d sources)",
-                      self.log_id, self._input_count)
-            return [
-                self._input_names.get(i, f"Input {i}") 
-                for i in range(1, self._input_count + 1)
-            ]
+        if self._input_list_cache is None:
+            # PRIORITY 2: Use runtime discovered names
+            if self._input_names and self._input_count > 0:
+                _LOG.debug("[%s] Using runtime discovered inputs (%d sources)",
+                          self.log_id, self._input_count)
+                self._input_list_cache = [
+                    self._input_names.get(i, f"Input {i}") 
+                    for i in range(1, self._input_count + 1)
+                ]
+            else:
+                # PRIORITY 3: Fallback to defaults
+                _LOG.debug("[%s] Using default input list (discovery incomplete)", self.log_id)
+                self._input_list_cache = list(_DEFAULT_INPUTS)
         
-        # PRIORITY 3: Fallback to defaults
-        _LOG.debug("[%s] Using default input list (discovery incomplete)", self.log_id)
-        return [
-            "HDMI 1", "HDMI 2", "HDMI 3", "HDMI 4",
-            "HDMI 5", "HDMI 6", "HDMI 7", "HDMI 8",
-            "Analog 1", "Analog 2",
-            "Digital 1", "Digital 2",
-            "USB", "Network", "ARC"
-        ]
-        return [self._input_names.get(i, f"Input {i}") for i in range(1, self._input_count + 1)]
+        return self._input_list_cache
     
     def get_input_number_by_name(self, name: str) -> int | None:
         """Get input number by name."""
-        for num, inp_name in self._input_names.items():
-            if inp_name == name:
-                return num
+        if self._input_name_to_num is None:
+            # Discovered names take precedence over the default mapping
+            discovered: dict[str, int] = {}
+            for num, inp_name in self._input_names.items():
+                discovered.setdefault(inp_name, num)
+            self._input_name_to_num = {**_DEFAULT_INPUT_NUMBERS, **discovered}
         
-        # Fallback to default mapping
-        default_map = {
-            "HDMI 1": 1, "HDMI 2": 2, "HDMI 3": 3, "HDMI 4": 4,
-            "HDMI 5": 5, "HDMI 6": 6, "HDMI 7": 7, "HDMI 8": 8,
-            "Analog 1": 9, "Analog 2": 10,
-            "Digital 1": 11, "Digital 2": 12,
-            "USB": 13, "Network": 14, "ARC": 15
-        }
-        return default_map.get(name)
+        return self._input_name_to_num.get(name)
+    
+    def _invalidate_input_caches(self) -> None:
+        """Drop memoized input lookups after discovery data changes."""
+        self._input_list_cache = None
+        self._input_name_to_num = None
     
     def get_zone_state(self, zone: int) -> dict[str, Any]:
         """Get current state for a zone."""
@@ -102,8 +102,7 @@ class AnthemMediaPlayer(MediaPlayer):
             elif cmd_id == Commands.VOLUME:
                 if params and "volume" in params:
                     volume_pct = float(params["volume"])
-                    # Convert percentage to dB (-90 to 0)
-                    volume_db = int((volume_pct * 90 / 100) - 90)
+                    volume_db = self._device.percentage_to_db(volume_pct)
                     success = await self._device.set_volume(volume_db, zone)
                     return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
                 return StatusCodes.BAD_REQUEST
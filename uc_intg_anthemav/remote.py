@@ -293,13 +293,6 @@ class AnthemRemote(Remote):
         
         _LOG.info("[%s] Remote entity initialized with %d commands and 3 UI pages", 
                   entity_id, len(simple_commands))
-        
-        # Register for device events
-        device.events.on("UPDATE", self._on_device_update)
-    
-    async def _on_device_update(self, entity_id: str, update_data: dict[str, Any]) -> None:
-        """Handle device state updates."""
-        pass
     
     async def handle_command(
         self,
@@ -120,18 +120,8 @@ class AnthemSetupFlow(BaseSetupFlow[AnthemDeviceConfig]):
             _LOG.info("SETUP: ✅ Connected! Waiting for input discovery...")
             
             # CRITICAL: Wait for input discovery to complete
-            max_wait = 5.0
-            wait_interval = 0.2
-            total_waited = 0.0
-            
-            while total_waited < max_wait:
-                await asyncio.sleep(wait_interval)
-                total_waited += wait_interval
-                
-                if discovery_device._input_count > 0:
-                    _LOG.info("SETUP: Input count discovered: %d", discovery_device._input_count)
-                    await asyncio.sleep(1.0)
-                    break
+            if await discovery_device.wait_for_inputs(timeout=5.0):
+                _LOG.info("SETUP: Input count discovered: %d", discovery_device._input_count)
             
             # Get discovered capabilities
             input_count = discovery_device._input_count